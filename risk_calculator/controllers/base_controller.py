@@ -38,6 +38,20 @@ class BaseController(ABC):
         self.field_values[field_name] = value
         self._on_field_change(field_name)
 
+    def set_field_values(self, values: Dict[str, str]) -> None:
+        """Set several field values and refresh validation state once."""
+        self.field_values.update(values)
+
+        for field_name in values:
+            self._validate_field_and_update_error(field_name)
+
+        # Single status and button refresh for the whole batch
+        self._update_validation_status()
+        self._update_calculate_button_state()
+
+        for field_name in values:
+            self._trigger_field_callbacks(field_name)
+
     def register_field_callback(self, field_name: str, callback: Callable) -> None:
         """Register a callback for field changes."""
         if field_name not in self.field_callbacks:
@@ -95,27 +109,33 @@ class BaseController(ABC):
 
     def _on_field_change(self, field_name: str) -> None:
         """Handle field value change for real-time validation."""
-        # Get current value
-        current_value = self.field_values.get(field_name, '')
+        # Perform real-time validation and update field error display
+        self._validate_field_and_update_error(field_name)
+
+        # Update overall validation status
+        self._update_validation_status()
 
-        # Perform real-time validation
+        # Update calculate button state
+        self._update_calculate_button_state()
+
+        # Trigger registered callbacks
+        self._trigger_field_callbacks(field_name)
+
+    def _validate_field_and_update_error(self, field_name: str) -> None:
+        """Validate a single field and show or clear its error."""
+        current_value = self.field_values.get(field_name, '')
         error_message = self._validate_single_field(field_name, current_value)
 
-        # Update field error display
         if error_message:
             self._show_field_error(field_name, error_message)
             self.has_errors = True
         else:
             self._clear_field_error(field_name)
 
-        # Update overall validation status
-        self._update_validation_status()
-
-        # Update calculate button state
-        self._update_calculate_button_state()
-
-        # Trigger registered callbacks
+    def _trigger_field_callbacks(self, field_name: str) -> None:
+        """Run callbacks registered for a field with its current value."""
         if field_name in self.field_callbacks:
+            current_value = self.field_values.get(field_name, '')
             for callback in self.field_callbacks[field_name]:
                 callback(current_value)
 
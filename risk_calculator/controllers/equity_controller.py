@@ -12,6 +12,34 @@ from ..services.validators import TradeValidationService
 from ..services.realtime_validator import RealTimeValidationService
 
 
+# Method-specific fields: required while selected, cleared when switching away
+EQUITY_METHOD_FIELDS = {
+    RiskMethod.PERCENTAGE: ('risk_percentage', 'stop_loss_price'),
+    RiskMethod.FIXED_AMOUNT: ('fixed_risk_amount', 'stop_loss_price'),
+    RiskMethod.LEVEL_BASED: ('support_resistance_level',)
+}
+
+# Fields required regardless of risk method
+EQUITY_BASE_REQUIRED_FIELDS = ('account_size', 'symbol', 'entry_price', 'trade_direction')
+
+# Required fields per risk method, built once at import
+EQUITY_REQUIRED_FIELDS = {
+    method: EQUITY_BASE_REQUIRED_FIELDS + fields for method, fields in EQUITY_METHOD_FIELDS.items()
+}
+
+# Fields persisted in session trade data
+EQUITY_SESSION_FIELDS = (
+    'account_size',
+    'symbol',
+    'entry_price',
+    'trade_direction',
+    'risk_percentage',
+    'fixed_risk_amount',
+    'stop_loss_price',
+    'support_resistance_level'
+)
+
+
 class EquityController(BaseController):
     """Controller for equity trading with all three risk methods supported."""
 
@@ -47,16 +75,7 @@ class EquityController(BaseController):
 
     def get_required_fields(self) -> List[str]:
         """Return list of required fields based on current risk method."""
-        base_fields = ['account_size', 'symbol', 'entry_price', 'trade_direction']
-
-        if self.current_risk_method == RiskMethod.PERCENTAGE:
-            return base_fields + ['risk_percentage', 'stop_loss_price']
-        elif self.current_risk_method == RiskMethod.FIXED_AMOUNT:
-            return base_fields + ['fixed_risk_amount', 'stop_loss_price']
-        elif self.current_risk_method == RiskMethod.LEVEL_BASED:
-            return base_fields + ['support_resistance_level']
-
-        return base_fields
+        return list(EQUITY_REQUIRED_FIELDS.get(self.current_risk_method, EQUITY_BASE_REQUIRED_FIELDS))
 
     def calculate_position(self) -> None:
         """Calculate equity position size based on current inputs."""
@@ -113,7 +132,7 @@ class EquityController(BaseController):
                 self.trade.entry_price = Decimal(entry_price_str)
 
             # Method-specific fields
-            if self.trade.risk_method == RiskMethod.PERCENTAGE:
+            if self.trade.risk_method is RiskMethod.PERCENTAGE:
                 risk_pct_str = self.field_values.get('risk_percentage', '').strip()
                 if risk_pct_str:
                     self.trade.risk_percentage = Decimal(risk_pct_str)
@@ -122,7 +141,7 @@ class EquityController(BaseController):
                 if stop_loss_str:
                     self.trade.stop_loss_price = Decimal(stop_loss_str)
 
-            elif self.trade.risk_method == RiskMethod.FIXED_AMOUNT:
+            elif self.trade.risk_method is RiskMethod.FIXED_AMOUNT:
                 fixed_amount_str = self.field_values.get('fixed_risk_amount', '').strip()
                 if fixed_amount_str:
                     self.trade.fixed_risk_amount = Decimal(fixed_amount_str)
@@ -131,7 +150,7 @@ class EquityController(BaseController):
                 if stop_loss_str:
                     self.trade.stop_loss_price = Decimal(stop_loss_str)
 
-            elif self.trade.risk_method == RiskMethod.LEVEL_BASED:
+            elif self.trade.risk_method is RiskMethod.LEVEL_BASED:
                 level_str = self.field_values.get('support_resistance_level', '').strip()
                 if level_str:
                     self.trade.support_resistance_level = Decimal(level_str)
@@ -185,16 +204,9 @@ class EquityController(BaseController):
 
     def _on_method_changed(self, old_method: RiskMethod, new_method: RiskMethod) -> None:
         """Handle risk method change for equity-specific behavior."""
-        # Clear method-specific fields when switching
-        method_fields = {
-            RiskMethod.PERCENTAGE: ['risk_percentage', 'stop_loss_price'],
-            RiskMethod.FIXED_AMOUNT: ['fixed_risk_amount', 'stop_loss_price'],
-            RiskMethod.LEVEL_BASED: ['support_resistance_level']
-        }
-
-        # Clear old method fields
-        if old_method in method_fields:
-            for field in method_fields[old_method]:
+        # Clear old method-specific fields when switching
+        if old_method in EQUITY_METHOD_FIELDS:
+            for field in EQUITY_METHOD_FIELDS[old_method]:
                 self.field_values[field] = ''
 
         # Update trade object
@@ -203,13 +215,13 @@ class EquityController(BaseController):
 
     def _reset_method_specific_trade_fields(self, old_method: RiskMethod) -> None:
         """Reset method-specific fields in trade object."""
-        if old_method == RiskMethod.PERCENTAGE:
+        if old_method is RiskMethod.PERCENTAGE:
             self.trade.risk_percentage = None
             self.trade.stop_loss_price = None
-        elif old_method == RiskMethod.FIXED_AMOUNT:
+        elif old_method is RiskMethod.FIXED_AMOUNT:
             self.trade.fixed_risk_amount = None
             self.trade.stop_loss_price = None
-        elif old_method == RiskMethod.LEVEL_BASED:
+        elif old_method is RiskMethod.LEVEL_BASED:
             self.trade.support_resistance_level = None
 
     def get_current_trade_data(self) -> Dict:
@@ -236,21 +248,11 @@ class EquityController(BaseController):
                 self.set_risk_method(risk_method)
 
             # Set other fields
-            field_mapping = {
-                'account_size': 'account_size',
-                'symbol': 'symbol',
-                'entry_price': 'entry_price',
-                'trade_direction': 'trade_direction',
-                'risk_percentage': 'risk_percentage',
-                'fixed_risk_amount': 'fixed_risk_amount',
-                'stop_loss_price': 'stop_loss_price',
-                'support_resistance_level': 'support_resistance_level'
-            }
-
-            for data_key, field_name in field_mapping.items():
-                if data_key in trade_data and trade_data[data_key] is not None:
-                    value = str(trade_data[data_key])
-                    self.set_field_value(field_name, value)
+            self.set_field_values({
+                field_name: str(trade_data[field_name])
+                for field_name in EQUITY_SESSION_FIELDS
+                if trade_data.get(field_name) is not None
+            })
 
         except Exception as e:
             # If loading fails, reset to defaults
@@ -12,6 +12,38 @@ from ..services.validators import TradeValidationService
 from ..services.realtime_validator import RealTimeValidationService
 
 
+# Method-specific fields: required while selected, cleared when switching away
+FUTURE_METHOD_FIELDS = {
+    RiskMethod.PERCENTAGE: ('risk_percentage', 'stop_loss_price'),
+    RiskMethod.FIXED_AMOUNT: ('fixed_risk_amount', 'stop_loss_price'),
+    RiskMethod.LEVEL_BASED: ('support_resistance_level',)
+}
+
+# Fields required regardless of risk method
+FUTURE_BASE_REQUIRED_FIELDS = ('account_size', 'contract_symbol', 'entry_price', 'tick_value',
+                               'tick_size', 'margin_requirement', 'trade_direction')
+
+# Required fields per risk method, built once at import
+FUTURE_REQUIRED_FIELDS = {
+    method: FUTURE_BASE_REQUIRED_FIELDS + fields for method, fields in FUTURE_METHOD_FIELDS.items()
+}
+
+# Fields persisted in session trade data
+FUTURE_SESSION_FIELDS = (
+    'account_size',
+    'contract_symbol',
+    'entry_price',
+    'trade_direction',
+    'tick_value',
+    'tick_size',
+    'margin_requirement',
+    'risk_percentage',
+    'fixed_risk_amount',
+    'stop_loss_price',
+    'support_resistance_level'
+)
+
+
 class FutureController(BaseController):
     """Controller for futures trading with all three risk methods and margin validation."""
 
@@ -51,17 +83,7 @@ class FutureController(BaseController):
 
     def get_required_fields(self) -> List[str]:
         """Return list of required fields based on current risk method."""
-        base_fields = ['account_size', 'contract_symbol', 'entry_price', 'tick_value',
-                      'tick_size', 'margin_requirement', 'trade_direction']
-
-        if self.current_risk_method == RiskMethod.PERCENTAGE:
-            return base_fields + ['risk_percentage', 'stop_loss_price']
-        elif self.current_risk_method == RiskMethod.FIXED_AMOUNT:
-            return base_fields + ['fixed_risk_amount', 'stop_loss_price']
-        elif self.current_risk_method == RiskMethod.LEVEL_BASED:
-            return base_fields + ['support_resistance_level']
-
-        return base_fields
+        return list(FUTURE_REQUIRED_FIELDS.get(self.current_risk_method, FUTURE_BASE_REQUIRED_FIELDS))
 
     def calculate_position(self) -> None:
         """Calculate futures position size based on current inputs."""
@@ -137,7 +159,7 @@ class FutureController(BaseController):
                 self.trade.margin_requirement = Decimal(margin_str)
 
             # Method-specific fields
-            if self.trade.risk_method == RiskMethod.PERCENTAGE:
+            if self.trade.risk_method is RiskMethod.PERCENTAGE:
                 risk_pct_str = self.field_values.get('risk_percentage', '').strip()
                 if risk_pct_str:
                     self.trade.risk_percentage = Decimal(risk_pct_str)
@@ -146,7 +168,7 @@ class FutureController(BaseController):
                 if stop_loss_str:
                     self.trade.stop_loss_price = Decimal(stop_loss_str)
 
-            elif self.trade.risk_method == RiskMethod.FIXED_AMOUNT:
+            elif self.trade.risk_method is RiskMethod.FIXED_AMOUNT:
                 fixed_amount_str = self.field_values.get('fixed_risk_amount', '').strip()
                 if fixed_amount_str:
                     self.trade.fixed_risk_amount = Decimal(fixed_amount_str)
@@ -155,7 +177,7 @@ class FutureController(BaseController):
                 if stop_loss_str:
                     self.trade.stop_loss_price = Decimal(stop_loss_str)
 
-            elif self.trade.risk_method == RiskMethod.LEVEL_BASED:
+            elif self.trade.risk_method is RiskMethod.LEVEL_BASED:
                 level_str = self.field_values.get('support_resistance_level', '').strip()
                 if level_str:
                     self.trade.support_resistance_level = Decimal(level_str)
@@ -220,20 +242,20 @@ class FutureController(BaseController):
 
     def _calculate_risk_amount(self) -> Decimal:
         """Calculate risk amount for validation."""
-        if self.trade.risk_method == RiskMethod.PERCENTAGE and self.trade.risk_percentage:
+        if self.trade.risk_method is RiskMethod.PERCENTAGE and self.trade.risk_percentage:
             return self.trade.account_size * self.trade.risk_percentage / Decimal('100')
-        elif self.trade.risk_method == RiskMethod.FIXED_AMOUNT and self.trade.fixed_risk_amount:
+        elif self.trade.risk_method is RiskMethod.FIXED_AMOUNT and self.trade.fixed_risk_amount:
             return self.trade.fixed_risk_amount
-        elif self.trade.risk_method == RiskMethod.LEVEL_BASED:
+        elif self.trade.risk_method is RiskMethod.LEVEL_BASED:
             return self.trade.account_size * Decimal('0.02')  # 2% default
         return Decimal('0')
 
     def _get_price_risk(self) -> Decimal:
         """Get price risk for validation."""
-        if self.trade.risk_method in [RiskMethod.PERCENTAGE, RiskMethod.FIXED_AMOUNT]:
+        if self.trade.risk_method in (RiskMethod.PERCENTAGE, RiskMethod.FIXED_AMOUNT):
             if self.trade.stop_loss_price and self.trade.entry_price:
                 return abs(self.trade.entry_price - self.trade.stop_loss_price)
-        elif self.trade.risk_method == RiskMethod.LEVEL_BASED:
+        elif self.trade.risk_method is RiskMethod.LEVEL_BASED:
             if self.trade.support_resistance_level and self.trade.entry_price:
                 return abs(self.trade.entry_price - self.trade.support_resistance_level)
         return Decimal('0')
@@ -310,16 +332,9 @@ class FutureController(BaseController):
 
     def _on_method_changed(self, old_method: RiskMethod, new_method: RiskMethod) -> None:
         """Handle risk method change for futures-specific behavior."""
-        # Clear method-specific fields when switching
-        method_fields = {
-            RiskMethod.PERCENTAGE: ['risk_percentage', 'stop_loss_price'],
-            RiskMethod.FIXED_AMOUNT: ['fixed_risk_amount', 'stop_loss_price'],
-            RiskMethod.LEVEL_BASED: ['support_resistance_level']
-        }
-
-        # Clear old method fields
-        if old_method in method_fields:
-            for field in method_fields[old_method]:
+        # Clear old method-specific fields when switching
+        if old_method in FUTURE_METHOD_FIELDS:
+            for field in FUTURE_METHOD_FIELDS[old_method]:
                 self.field_values[field] = ''
 
         # Update trade object
@@ -328,13 +343,13 @@ class FutureController(BaseController):
 
     def _reset_method_specific_trade_fields(self, old_method: RiskMethod) -> None:
         """Reset method-specific fields in trade object."""
-        if old_method == RiskMethod.PERCENTAGE:
+        if old_method is RiskMethod.PERCENTAGE:
             self.trade.risk_percentage = None
             self.trade.stop_loss_price = None
-        elif old_method == RiskMethod.FIXED_AMOUNT:
+        elif old_method is RiskMethod.FIXED_AMOUNT:
             self.trade.fixed_risk_amount = None
             self.trade.stop_loss_price = None
-        elif old_method == RiskMethod.LEVEL_BASED:
+        elif old_method is RiskMethod.LEVEL_BASED:
             self.trade.support_resistance_level = None
 
     def get_current_trade_data(self) -> Dict:
@@ -364,24 +379,11 @@ class FutureController(BaseController):
                 self.set_risk_method(risk_method)
 
             # Set other fields
-            field_mapping = {
-                'account_size': 'account_size',
-                'contract_symbol': 'contract_symbol',
-                'entry_price': 'entry_price',
-                'trade_direction': 'trade_direction',
-                'tick_value': 'tick_value',
-                'tick_size': 'tick_size',
-                'margin_requirement': 'margin_requirement',
-                'risk_percentage': 'risk_percentage',
-                'fixed_risk_amount': 'fixed_risk_amount',
-                'stop_loss_price': 'stop_loss_price',
-                'support_resistance_level': 'support_resistance_level'
-            }
-
-            for data_key, field_name in field_mapping.items():
-                if data_key in trade_data and trade_data[data_key] is not None:
-                    value = str(trade_data[data_key])
-                    self.set_field_value(field_name, value)
+            self.set_field_values({
+                field_name: str(trade_data[field_name])
+                for field_name in FUTURE_SESSION_FIELDS
+                if trade_data.get(field_name) is not None
+            })
 
         except Exception as e:
             # If loading fails, reset to defaults
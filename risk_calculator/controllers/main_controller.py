@@ -7,6 +7,14 @@ from .future_controller import FutureController
 from ..models.risk_method import RiskMethod
 
 
+# Window titles shown for each tab
+TAB_TITLES = {
+    'equity': 'Risk Calculator - Equity Trading',
+    'option': 'Risk Calculator - Option Trading',
+    'future': 'Risk Calculator - Futures Trading'
+}
+
+
 class MainController:
     """Main application controller that manages tabs and coordinates between controllers."""
 
@@ -75,14 +83,8 @@ class MainController:
     def _handle_tab_change_ui_updates(self, old_tab: Optional[str], new_tab: str) -> None:
         """Handle UI updates when tabs change."""
         # Update window title
-        tab_titles = {
-            'equity': 'Risk Calculator - Equity Trading',
-            'option': 'Risk Calculator - Option Trading',
-            'future': 'Risk Calculator - Futures Trading'
-        }
-
         if hasattr(self.main_view, 'set_title'):
-            title = tab_titles.get(new_tab, 'Risk Calculator')
+            title = TAB_TITLES.get(new_tab, 'Risk Calculator')
             self.main_view.set_title(title)
 
         # Update any shared UI elements
@@ -92,7 +94,7 @@ class MainController:
     def set_global_risk_method(self, risk_method: RiskMethod) -> None:
         """Set risk method across all tabs (synchronized setting)."""
         for controller_name, controller in self.controllers.items():
-            if controller_name == 'option' and risk_method == RiskMethod.LEVEL_BASED:
+            if controller_name == 'option' and risk_method is RiskMethod.LEVEL_BASED:
                 # Skip setting level-based for options
                 continue
 
@@ -12,6 +12,32 @@ from ..services.validators import TradeValidationService
 from ..services.realtime_validator import RealTimeValidationService
 
 
+# Method-specific fields: required while selected, cleared when switching away
+OPTION_METHOD_FIELDS = {
+    RiskMethod.PERCENTAGE: ('risk_percentage',),
+    RiskMethod.FIXED_AMOUNT: ('fixed_risk_amount',)
+}
+
+# Fields required regardless of risk method
+OPTION_BASE_REQUIRED_FIELDS = ('account_size', 'option_symbol', 'premium', 'contract_multiplier', 'trade_direction')
+
+# Required fields per risk method, built once at import
+OPTION_REQUIRED_FIELDS = {
+    method: OPTION_BASE_REQUIRED_FIELDS + fields for method, fields in OPTION_METHOD_FIELDS.items()
+}
+
+# Fields persisted in session trade data
+OPTION_SESSION_FIELDS = (
+    'account_size',
+    'option_symbol',
+    'premium',
+    'contract_multiplier',
+    'trade_direction',
+    'risk_percentage',
+    'fixed_risk_amount'
+)
+
+
 class OptionController(BaseController):
     """Controller for option trading with level-based method disabled."""
 
@@ -46,21 +72,11 @@ class OptionController(BaseController):
 
     def get_required_fields(self) -> List[str]:
         """Return list of required fields based on current risk method."""
-        base_fields = ['account_size', 'option_symbol', 'premium', 'contract_multiplier', 'trade_direction']
-
-        if self.current_risk_method == RiskMethod.PERCENTAGE:
-            return base_fields + ['risk_percentage']
-        elif self.current_risk_method == RiskMethod.FIXED_AMOUNT:
-            return base_fields + ['fixed_risk_amount']
-        elif self.current_risk_method == RiskMethod.LEVEL_BASED:
-            # Level-based not supported for options
-            return base_fields
-
-        return base_fields
+        return list(OPTION_REQUIRED_FIELDS.get(self.current_risk_method, OPTION_BASE_REQUIRED_FIELDS))
 
     def _is_method_supported(self, method: RiskMethod) -> bool:
         """Check if the risk method is supported by options."""
-        return method != RiskMethod.LEVEL_BASED
+        return method is not RiskMethod.LEVEL_BASED
 
     def calculate_position(self) -> None:
         """Calculate option position size based on current inputs."""
@@ -68,7 +84,7 @@ class OptionController(BaseController):
             return
 
         # Check if level-based method is selected (should be disabled in UI)
-        if self.current_risk_method == RiskMethod.LEVEL_BASED:
+        if self.current_risk_method is RiskMethod.LEVEL_BASED:
             self._show_calculation_error("Level-based method not supported for options trading")
             return
 
@@ -127,12 +143,12 @@ class OptionController(BaseController):
                 self.trade.contract_multiplier = int(multiplier_str)
 
             # Method-specific fields
-            if self.trade.risk_method == RiskMethod.PERCENTAGE:
+            if self.trade.risk_method is RiskMethod.PERCENTAGE:
                 risk_pct_str = self.field_values.get('risk_percentage', '').strip()
                 if risk_pct_str:
                     self.trade.risk_percentage = Decimal(risk_pct_str)
 
-            elif self.trade.risk_method == RiskMethod.FIXED_AMOUNT:
+            elif self.trade.risk_method is RiskMethod.FIXED_AMOUNT:
                 fixed_amount_str = self.field_values.get('fixed_risk_amount', '').strip()
                 if fixed_amount_str:
                     self.trade.fixed_risk_amount = Decimal(fixed_amount_str)
@@ -195,7 +211,7 @@ class OptionController(BaseController):
     def _on_method_changed(self, old_method: RiskMethod, new_method: RiskMethod) -> None:
         """Handle risk method change for option-specific behavior."""
         # Prevent switching to level-based method
-        if new_method == RiskMethod.LEVEL_BASED:
+        if new_method is RiskMethod.LEVEL_BASED:
             # Revert to previous method
             self.field_values['risk_method'] = old_method.value
             self.current_risk_method = old_method
@@ -204,15 +220,9 @@ class OptionController(BaseController):
             self._show_unsupported_method_error(new_method)
             return
 
-        # Clear method-specific fields when switching
-        method_fields = {
-            RiskMethod.PERCENTAGE: ['risk_percentage'],
-            RiskMethod.FIXED_AMOUNT: ['fixed_risk_amount']
-        }
-
-        # Clear old method fields
-        if old_method in method_fields:
-            for field in method_fields[old_method]:
+        # Clear old method-specific fields when switching
+        if old_method in OPTION_METHOD_FIELDS:
+            for field in OPTION_METHOD_FIELDS[old_method]:
                 self.field_values[field] = ''
 
         # Update trade object
@@ -221,9 +231,9 @@ class OptionController(BaseController):
 
     def _reset_method_specific_trade_fields(self, old_method: RiskMethod) -> None:
         """Reset method-specific fields in trade object."""
-        if old_method == RiskMethod.PERCENTAGE:
+        if old_method is RiskMethod.PERCENTAGE:
             self.trade.risk_percentage = None
-        elif old_method == RiskMethod.FIXED_AMOUNT:
+        elif old_method is RiskMethod.FIXED_AMOUNT:
             self.trade.fixed_risk_amount = None
 
     def get_current_trade_data(self) -> Dict:
@@ -246,27 +256,18 @@ class OptionController(BaseController):
             # Set risk method first (but not level-based)
             if 'risk_method' in trade_data:
                 risk_method = RiskMethod(trade_data['risk_method'])
-                if risk_method != RiskMethod.LEVEL_BASED:
+                if risk_method is not RiskMethod.LEVEL_BASED:
                     self.set_risk_method(risk_method)
                 else:
                     # Default to percentage method if trying to load level-based
                     self.set_risk_method(RiskMethod.PERCENTAGE)
 
             # Set other fields
-            field_mapping = {
-                'account_size': 'account_size',
-                'option_symbol': 'option_symbol',
-                'premium': 'premium',
-                'contract_multiplier': 'contract_multiplier',
-                'trade_direction': 'trade_direction',
-                'risk_percentage': 'risk_percentage',
-                'fixed_risk_amount': 'fixed_risk_amount'
-            }
-
-            for data_key, field_name in field_mapping.items():
-                if data_key in trade_data and trade_data[data_key] is not None:
-                    value = str(trade_data[data_key])
-                    self.set_field_value(field_name, value)
+            self.set_field_values({
+                field_name: str(trade_data[field_name])
+                for field_name in OPTION_SESSION_FIELDS
+                if trade_data.get(field_name) is not None
+            })
 
         except Exception as e:
             # If loading fails, reset to defaults
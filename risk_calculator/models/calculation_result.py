@@ -55,10 +55,10 @@ class CalculationResult:
                        risk_percentage: Optional[Decimal] = None,
                        fixed_risk_amount: Optional[Decimal] = None) -> Decimal:
         """Calculate the risk amount based on method (for display purposes)."""
-        if risk_method == RiskMethod.PERCENTAGE and risk_percentage is not None:
+        if risk_method is RiskMethod.PERCENTAGE and risk_percentage is not None:
             return account_size * risk_percentage / Decimal('100')
-        elif risk_method == RiskMethod.FIXED_AMOUNT and fixed_risk_amount is not None:
+        elif risk_method is RiskMethod.FIXED_AMOUNT and fixed_risk_amount is not None:
             return fixed_risk_amount
-        elif risk_method == RiskMethod.LEVEL_BASED:
+        elif risk_method is RiskMethod.LEVEL_BASED:
             return account_size * Decimal('0.02')  # Default 2%
         return Decimal('0')
\ No newline at end of file
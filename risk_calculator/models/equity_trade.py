@@ -32,15 +32,15 @@ class EquityTrade(Trade):
         """Actual risk amount for calculated position."""
         shares = self.position_size
         risk_per_share = self._get_risk_per_share()
-        return Decimal(str(shares)) * risk_per_share
+        return Decimal(shares) * risk_per_share
 
     def _get_risk_per_share(self) -> Decimal:
         """Calculate risk per share based on selected method."""
-        if self.risk_method in [RiskMethod.PERCENTAGE, RiskMethod.FIXED_AMOUNT]:
+        if self.risk_method in (RiskMethod.PERCENTAGE, RiskMethod.FIXED_AMOUNT):
             if self.stop_loss_price is None or self.entry_price <= 0:
                 return Decimal('0')
             return abs(self.entry_price - self.stop_loss_price)
-        elif self.risk_method == RiskMethod.LEVEL_BASED:
+        elif self.risk_method is RiskMethod.LEVEL_BASED:
             if self.support_resistance_level is None or self.entry_price <= 0:
                 return Decimal('0')
             return abs(self.entry_price - self.support_resistance_level)
@@ -56,7 +56,7 @@ class EquityTrade(Trade):
 
     def is_valid_stop_loss_price(self) -> bool:
         """Validate stop loss price based on trade direction."""
-        if self.risk_method not in [RiskMethod.PERCENTAGE, RiskMethod.FIXED_AMOUNT]:
+        if self.risk_method not in (RiskMethod.PERCENTAGE, RiskMethod.FIXED_AMOUNT):
             return True
 
         if self.stop_loss_price is None or self.stop_loss_price <= 0:
@@ -71,7 +71,7 @@ class EquityTrade(Trade):
 
     def is_valid_support_resistance_level(self) -> bool:
         """Validate support/resistance level based on trade direction."""
-        if self.risk_method != RiskMethod.LEVEL_BASED:
+        if self.risk_method is not RiskMethod.LEVEL_BASED:
             return True
 
         if self.support_resistance_level is None or self.support_resistance_level <= 0:
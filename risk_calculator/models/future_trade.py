@@ -35,7 +35,7 @@ class FutureTrade(Trade):
         """Actual risk amount for calculated position."""
         contracts = self.position_size
         risk_per_contract = self._get_risk_per_contract()
-        return Decimal(str(contracts)) * risk_per_contract
+        return Decimal(contracts) * risk_per_contract
 
     def _get_risk_per_contract(self) -> Decimal:
         """Calculate risk per contract based on ticks at risk."""
@@ -48,11 +48,11 @@ class FutureTrade(Trade):
 
     def _get_price_risk(self) -> Decimal:
         """Calculate price risk based on method."""
-        if self.risk_method in [RiskMethod.PERCENTAGE, RiskMethod.FIXED_AMOUNT]:
+        if self.risk_method in (RiskMethod.PERCENTAGE, RiskMethod.FIXED_AMOUNT):
             if self.stop_loss_price is None or self.entry_price <= 0:
                 return Decimal('0')
             return abs(self.entry_price - self.stop_loss_price)
-        elif self.risk_method == RiskMethod.LEVEL_BASED:
+        elif self.risk_method is RiskMethod.LEVEL_BASED:
             if self.support_resistance_level is None or self.entry_price <= 0:
                 return Decimal('0')
             return abs(self.entry_price - self.support_resistance_level)
@@ -85,7 +85,7 @@ class FutureTrade(Trade):
 
     def is_valid_stop_loss_price(self) -> bool:
         """Validate stop loss price based on trade direction."""
-        if self.risk_method not in [RiskMethod.PERCENTAGE, RiskMethod.FIXED_AMOUNT]:
+        if self.risk_method not in (RiskMethod.PERCENTAGE, RiskMethod.FIXED_AMOUNT):
             return True
 
         if self.stop_loss_price is None or self.stop_loss_price <= 0:
@@ -100,7 +100,7 @@ class FutureTrade(Trade):
 
     def is_valid_support_resistance_level(self) -> bool:
         """Validate support/resistance level based on trade direction."""
-        if self.risk_method != RiskMethod.LEVEL_BASED:
+        if self.risk_method is not RiskMethod.LEVEL_BASED:
             return True
 
         if self.support_resistance_level is None or self.support_resistance_level <= 0:
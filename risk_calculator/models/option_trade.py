@@ -18,7 +18,7 @@ class OptionTrade(Trade):
     def position_size(self) -> int:
         """Calculate number of contracts based on risk method."""
         # Level-based method not supported for options
-        if self.risk_method == RiskMethod.LEVEL_BASED:
+        if self.risk_method is RiskMethod.LEVEL_BASED:
             return 0
 
         cost_per_contract = self._get_cost_per_contract()
@@ -33,7 +33,7 @@ class OptionTrade(Trade):
         """Actual risk amount for calculated position."""
         contracts = self.position_size
         cost_per_contract = self._get_cost_per_contract()
-        return Decimal(str(contracts)) * cost_per_contract
+        return Decimal(contracts) * cost_per_contract
 
     def _get_cost_per_contract(self) -> Decimal:
         """Calculate cost per contract (premium × multiplier)."""
@@ -19,13 +19,13 @@ class Trade(ABC):
     @property
     def calculated_risk_amount(self) -> Decimal:
         """Calculate risk amount based on selected method."""
-        if self.risk_method == RiskMethod.PERCENTAGE:
+        if self.risk_method is RiskMethod.PERCENTAGE:
             if self.risk_percentage is None:
                 return Decimal('0')
             return self.account_size * self.risk_percentage / Decimal('100')
-        elif self.risk_method == RiskMethod.FIXED_AMOUNT:
+        elif self.risk_method is RiskMethod.FIXED_AMOUNT:
             return self.fixed_risk_amount or Decimal('0')
-        elif self.risk_method == RiskMethod.LEVEL_BASED:
+        elif self.risk_method is RiskMethod.LEVEL_BASED:
             return self.account_size * Decimal('0.02')  # Default 2%
         return Decimal('0')
 
@@ -48,13 +48,13 @@ class Trade(ABC):
     def is_valid_risk_percentage(self) -> bool:
         """Validate risk percentage is within 1-5% range."""
         if self.risk_percentage is None:
-            return self.risk_method != RiskMethod.PERCENTAGE
+            return self.risk_method is not RiskMethod.PERCENTAGE
         return Decimal('1.0') <= self.risk_percentage <= Decimal('5.0')
 
     def is_valid_fixed_risk_amount(self) -> bool:
         """Validate fixed risk amount is within range and account limits."""
         if self.fixed_risk_amount is None:
-            return self.risk_method != RiskMethod.FIXED_AMOUNT
+            return self.risk_method is not RiskMethod.FIXED_AMOUNT
 
         # Check range $10-$500
         if not (Decimal('10') <= self.fixed_risk_amount <= Decimal('500')):
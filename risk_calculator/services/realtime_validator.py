@@ -6,6 +6,31 @@ from .validators import BaseValidationService
 from ..models.risk_method import RiskMethod
 
 
+# Field groups validated per keystroke, with display labels built once
+POSITIVE_DECIMAL_FIELDS = frozenset({
+    "entry_price", "stop_loss_price", "support_resistance_level", "premium",
+    "tick_value", "tick_size", "margin_requirement",
+})
+REQUIRED_STRING_FIELDS = frozenset({"symbol", "option_symbol", "contract_symbol"})
+FIELD_LABELS = {
+    name: name.replace('_', ' ').title()
+    for name in POSITIVE_DECIMAL_FIELDS | REQUIRED_STRING_FIELDS
+}
+
+# Input hints shown next to fields
+FIELD_SUGGESTIONS = {
+    "risk_percentage": "Enter 1-5% (e.g., 2.0 for 2%)",
+    "fixed_risk_amount": "Enter $10-$500 (max 5% of account)",
+    "entry_price": "Enter positive price in dollars",
+    "stop_loss_price": "Must be below entry for long, above for short",
+    "support_resistance_level": "Enter key technical level price",
+    "premium": "Enter option premium per share",
+    "tick_value": "Dollar value per tick movement",
+    "tick_size": "Minimum price increment",
+    "margin_requirement": "Initial margin per contract"
+}
+
+
 class RealTimeValidationService:
     """Handles real-time field validation for Tkinter UI."""
 
@@ -28,12 +53,10 @@ class RealTimeValidationService:
                     self.trade_validator.validate_fixed_amount(value, current_trade.account_size, "Fixed risk amount")
                 else:
                     self.trade_validator.validate_decimal_range(value, "Fixed risk amount", Decimal('10'), Decimal('500'))
-            elif field_name in ["entry_price", "stop_loss_price", "support_resistance_level", "premium"]:
-                self.trade_validator.validate_positive_decimal(value, field_name.replace('_', ' ').title())
-            elif field_name in ["symbol", "option_symbol", "contract_symbol"]:
-                self.trade_validator.validate_required_string(value, field_name.replace('_', ' ').title())
-            elif field_name in ["tick_value", "tick_size", "margin_requirement"]:
-                self.trade_validator.validate_positive_decimal(value, field_name.replace('_', ' ').title())
+            elif field_name in POSITIVE_DECIMAL_FIELDS:
+                self.trade_validator.validate_positive_decimal(value, FIELD_LABELS[field_name])
+            elif field_name in REQUIRED_STRING_FIELDS:
+                self.trade_validator.validate_required_string(value, FIELD_LABELS[field_name])
 
             return None  # No error
 
@@ -44,7 +67,7 @@ class RealTimeValidationService:
 
     def validate_method_compatibility(self, risk_method: RiskMethod, trade_type: str) -> Optional[str]:
         """Validate if risk method is compatible with trade type."""
-        if trade_type == "option" and risk_method == RiskMethod.LEVEL_BASED:
+        if trade_type == "option" and risk_method is RiskMethod.LEVEL_BASED:
             return "Level-based method not supported for options trading"
 
         return None
@@ -96,19 +119,7 @@ class RealTimeValidationService:
 
     def get_field_suggestions(self, field_name: str, trade_type: str) -> str:
         """Get helpful suggestions for field inputs."""
-        suggestions = {
-            "risk_percentage": "Enter 1-5% (e.g., 2.0 for 2%)",
-            "fixed_risk_amount": "Enter $10-$500 (max 5% of account)",
-            "entry_price": "Enter positive price in dollars",
-            "stop_loss_price": "Must be below entry for long, above for short",
-            "support_resistance_level": "Enter key technical level price",
-            "premium": "Enter option premium per share",
-            "tick_value": "Dollar value per tick movement",
-            "tick_size": "Minimum price increment",
-            "margin_requirement": "Initial margin per contract"
-        }
-
-        return suggestions.get(field_name, "Enter valid value")
+        return FIELD_SUGGESTIONS.get(field_name, "Enter valid value")
 
     def format_validation_message(self, field_name: str, error_message: str) -> str:
         """Format validation message for display."""
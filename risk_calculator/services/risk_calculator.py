@@ -8,6 +8,14 @@ from ..models.future_trade import FutureTrade
 from ..models.calculation_result import CalculationResult
 from ..models.risk_method import RiskMethod
 
+# Shared Decimal constants so hot calculation paths avoid re-parsing literals
+WHOLE_UNIT = Decimal('1')
+ZERO = Decimal('0')
+HUNDRED = Decimal('100')
+MAX_POSITION_ACCOUNT_RATIO = Decimal('0.25')
+OPTION_RISK_TOLERANCE = Decimal('1.1')
+DEFAULT_LEVEL_RISK_PERCENTAGE = Decimal('0.02')  # 2% for level-based
+
 
 class RiskCalculationService:
     """Provides risk calculation methods for different asset classes."""
@@ -15,7 +23,6 @@ class RiskCalculationService:
     def __init__(self):
         # Set consistent precision for cross-platform compatibility
         getcontext().prec = 28
-        self.DEFAULT_LEVEL_RISK_PERCENTAGE = Decimal('0.02')  # 2% for level-based
 
     def calculate_equity_position(self, trade: EquityTrade) -> CalculationResult:
         """Calculate equity position size based on selected risk method."""
@@ -40,19 +47,19 @@ class RiskCalculationService:
                 return result
 
             # Calculate position size
-            position_size = int((risk_amount / risk_per_share).quantize(Decimal('1'), rounding=ROUND_DOWN))
-            estimated_risk = Decimal(str(position_size)) * risk_per_share
+            position_size = int((risk_amount / risk_per_share).quantize(WHOLE_UNIT, rounding=ROUND_DOWN))
+            estimated_risk = Decimal(position_size) * risk_per_share
 
             # Check position size limits
             max_position_by_capital = int(trade.account_size / trade.entry_price)
             if position_size > max_position_by_capital:
                 result.add_warning(f"Position size limited by account capital: {max_position_by_capital} shares")
                 position_size = max_position_by_capital
-                estimated_risk = Decimal(str(position_size)) * risk_per_share
+                estimated_risk = Decimal(position_size) * risk_per_share
 
             # Check if position exceeds 25% of account value
-            position_value = Decimal(str(position_size)) * trade.entry_price
-            if position_value > trade.account_size * Decimal('0.25'):
+            position_value = Decimal(position_size) * trade.entry_price
+            if position_value > trade.account_size * MAX_POSITION_ACCOUNT_RATIO:
                 result.add_warning("Position size exceeds 25% of account value")
 
             result.set_success(position_size, estimated_risk, trade.risk_method)
@@ -68,7 +75,7 @@ class RiskCalculationService:
 
         try:
             # Level-based method not supported for options
-            if trade.risk_method == RiskMethod.LEVEL_BASED:
+            if trade.risk_method is RiskMethod.LEVEL_BASED:
                 result.set_error("Level-based method not applicable for options")
                 return result
 
@@ -91,11 +98,11 @@ class RiskCalculationService:
             cost_per_contract = trade.premium * Decimal(str(trade.contract_multiplier))
 
             # Calculate position size
-            position_size = int((risk_amount / cost_per_contract).quantize(Decimal('1'), rounding=ROUND_DOWN))
-            estimated_risk = Decimal(str(position_size)) * cost_per_contract
+            position_size = int((risk_amount / cost_per_contract).quantize(WHOLE_UNIT, rounding=ROUND_DOWN))
+            estimated_risk = Decimal(position_size) * cost_per_contract
 
             # Check if premium cost is reasonable
-            if estimated_risk > risk_amount * Decimal('1.1'):  # 10% tolerance
+            if estimated_risk > risk_amount * OPTION_RISK_TOLERANCE:  # 10% tolerance
                 result.add_warning("Premium cost exceeds risk tolerance")
 
             result.set_success(position_size, estimated_risk, trade.risk_method)
@@ -136,17 +143,17 @@ class RiskCalculationService:
             risk_per_contract = ticks_at_risk * trade.tick_value
 
             # Calculate position size
-            position_size = int((risk_amount / risk_per_contract).quantize(Decimal('1'), rounding=ROUND_DOWN))
-            estimated_risk = Decimal(str(position_size)) * risk_per_contract
+            position_size = int((risk_amount / risk_per_contract).quantize(WHOLE_UNIT, rounding=ROUND_DOWN))
+            estimated_risk = Decimal(position_size) * risk_per_contract
 
             # Check margin requirements
-            total_margin = Decimal(str(position_size)) * trade.margin_requirement
+            total_margin = Decimal(position_size) * trade.margin_requirement
             if total_margin > trade.account_size:
                 result.add_warning("Insufficient margin for calculated position")
                 # Adjust position size to fit margin
                 max_contracts = int(trade.account_size / trade.margin_requirement)
                 position_size = max_contracts
-                estimated_risk = Decimal(str(position_size)) * risk_per_contract
+                estimated_risk = Decimal(position_size) * risk_per_contract
 
             result.set_success(position_size, estimated_risk, trade.risk_method)
 
@@ -163,38 +170,38 @@ class RiskCalculationService:
 
     def _calculate_risk_amount(self, trade) -> Decimal:
         """Calculate risk amount based on selected method."""
-        if trade.risk_method == RiskMethod.PERCENTAGE:
+        if trade.risk_method is RiskMethod.PERCENTAGE:
             if not hasattr(trade, 'risk_percentage') or trade.risk_percentage is None:
-                return Decimal('0')
-            return trade.account_size * trade.risk_percentage / Decimal('100')
-        elif trade.risk_method == RiskMethod.FIXED_AMOUNT:
+                return ZERO
+            return trade.account_size * trade.risk_percentage / HUNDRED
+        elif trade.risk_method is RiskMethod.FIXED_AMOUNT:
             if not hasattr(trade, 'fixed_risk_amount') or trade.fixed_risk_amount is None:
-                return Decimal('0')
+                return ZERO
             return trade.fixed_risk_amount
-        elif trade.risk_method == RiskMethod.LEVEL_BASED:
-            return trade.account_size * self.DEFAULT_LEVEL_RISK_PERCENTAGE
-        return Decimal('0')
+        elif trade.risk_method is RiskMethod.LEVEL_BASED:
+            return trade.account_size * DEFAULT_LEVEL_RISK_PERCENTAGE
+        return ZERO
 
     def _get_equity_risk_per_share(self, trade: EquityTrade) -> Decimal:
         """Calculate risk per share for equity trades."""
-        if trade.risk_method in [RiskMethod.PERCENTAGE, RiskMethod.FIXED_AMOUNT]:
+        if trade.risk_method in (RiskMethod.PERCENTAGE, RiskMethod.FIXED_AMOUNT):
             if trade.stop_loss_price is None or trade.entry_price <= 0:
-                return Decimal('0')
+                return ZERO
             return abs(trade.entry_price - trade.stop_loss_price)
-        elif trade.risk_method == RiskMethod.LEVEL_BASED:
+        elif trade.risk_method is RiskMethod.LEVEL_BASED:
             if trade.support_resistance_level is None or trade.entry_price <= 0:
-                return Decimal('0')
+                return ZERO
             return abs(trade.entry_price - trade.support_resistance_level)
-        return Decimal('0')
+        return ZERO
 
     def _get_futures_price_risk(self, trade: FutureTrade) -> Decimal:
         """Calculate price risk for futures trades."""
-        if trade.risk_method in [RiskMethod.PERCENTAGE, RiskMethod.FIXED_AMOUNT]:
+        if trade.risk_method in (RiskMethod.PERCENTAGE, RiskMethod.FIXED_AMOUNT):
             if trade.stop_loss_price is None or trade.entry_price <= 0:
-                return Decimal('0')
+                return ZERO
             return abs(trade.entry_price - trade.stop_loss_price)
-        elif trade.risk_method == RiskMethod.LEVEL_BASED:
+        elif trade.risk_method is RiskMethod.LEVEL_BASED:
             if trade.support_resistance_level is None or trade.entry_price <= 0:
-                return Decimal('0')
+                return ZERO
             return abs(trade.entry_price - trade.support_resistance_level)
-        return Decimal('0')
\ No newline at end of file
+        return ZERO
\ No newline at end of file
@@ -16,7 +16,7 @@ class BaseValidationService:
         """Validate and convert to positive decimal."""
         try:
             decimal_value = Decimal(value.strip())
-            if decimal_value <= 0:
+            if not decimal_value.is_finite() or decimal_value <= 0:
                 raise ValueError(f"{field_name} must be greater than 0")
             return decimal_value
         except (InvalidOperation, ValueError) as e:
@@ -61,13 +61,13 @@ class TradeValidationService(BaseValidationService):
             self._validate_equity_specific_fields(trade, result)
 
             # Method-specific validation
-            if trade.risk_method == RiskMethod.PERCENTAGE:
+            if trade.risk_method is RiskMethod.PERCENTAGE:
                 self._validate_percentage_method(trade, result)
                 self._validate_stop_loss_equity(trade, result)
-            elif trade.risk_method == RiskMethod.FIXED_AMOUNT:
+            elif trade.risk_method is RiskMethod.FIXED_AMOUNT:
                 self._validate_fixed_amount_method(trade, result)
                 self._validate_stop_loss_equity(trade, result)
-            elif trade.risk_method == RiskMethod.LEVEL_BASED:
+            elif trade.risk_method is RiskMethod.LEVEL_BASED:
                 self._validate_level_based_method_equity(trade, result)
 
         except Exception as e:
@@ -85,11 +85,11 @@ class TradeValidationService(BaseValidationService):
             self._validate_option_specific_fields(trade, result)
 
             # Method-specific validation (no level-based for options)
-            if trade.risk_method == RiskMethod.PERCENTAGE:
+            if trade.risk_method is RiskMethod.PERCENTAGE:
                 self._validate_percentage_method(trade, result)
-            elif trade.risk_method == RiskMethod.FIXED_AMOUNT:
+            elif trade.risk_method is RiskMethod.FIXED_AMOUNT:
                 self._validate_fixed_amount_method(trade, result)
-            elif trade.risk_method == RiskMethod.LEVEL_BASED:
+            elif trade.risk_method is RiskMethod.LEVEL_BASED:
                 result.add_error("risk_method", "Level-based method not supported for options trading")
 
         except Exception as e:
@@ -107,13 +107,13 @@ class TradeValidationService(BaseValidationService):
             self._validate_future_specific_fields(trade, result)
 
             # Method-specific validation
-            if trade.risk_method == RiskMethod.PERCENTAGE:
+            if trade.risk_method is RiskMethod.PERCENTAGE:
                 self._validate_percentage_method(trade, result)
                 self._validate_stop_loss_future(trade, result)
-            elif trade.risk_method == RiskMethod.FIXED_AMOUNT:
+            elif trade.risk_method is RiskMethod.FIXED_AMOUNT:
                 self._validate_fixed_amount_method(trade, result)
                 self._validate_stop_loss_future(trade, result)
-            elif trade.risk_method == RiskMethod.LEVEL_BASED:
+            elif trade.risk_method is RiskMethod.LEVEL_BASED:
                 self._validate_level_based_method_future(trade, result)
 
         except Exception as e:
@@ -168,9 +168,10 @@ class TradeValidationService(BaseValidationService):
         """Validate equity-specific fields."""
         # Symbol validation
         try:
-            if not trade.symbol or not trade.symbol.strip():
+            symbol = trade.symbol.strip() if trade.symbol else ''
+            if not symbol:
                 result.add_error("symbol", "Stock symbol is required")
-            elif len(trade.symbol.strip()) > 10:
+            elif len(symbol) > 10:
                 result.add_error("symbol", "Stock symbol cannot exceed 10 characters")
         except AttributeError:
             result.add_error("symbol", "Valid stock symbol is required")
@@ -109,11 +109,11 @@ class FuturesView(BaseTradingView):
 
     def build_method_fields(self) -> ft.Control:
         """Build method-specific input fields based on current risk method."""
-        if self.current_method == RiskMethod.PERCENTAGE:
+        if self.current_method is RiskMethod.PERCENTAGE:
             return self.build_percentage_fields()
-        elif self.current_method == RiskMethod.FIXED_AMOUNT:
+        elif self.current_method is RiskMethod.FIXED_AMOUNT:
             return self.build_fixed_amount_fields()
-        elif self.current_method == RiskMethod.LEVEL_BASED:
+        elif self.current_method is RiskMethod.LEVEL_BASED:
             return self.build_level_based_fields()
         return ft.Container()
 
@@ -125,9 +125,9 @@ class OptionsView(BaseTradingView):
 
     def build_method_fields(self) -> ft.Control:
         """Build method-specific input fields (only percentage and fixed amount)."""
-        if self.current_method == RiskMethod.PERCENTAGE:
+        if self.current_method is RiskMethod.PERCENTAGE:
             return self.build_percentage_fields()
-        elif self.current_method == RiskMethod.FIXED_AMOUNT:
+        elif self.current_method is RiskMethod.FIXED_AMOUNT:
             return self.build_fixed_amount_fields()
         # Level-based not supported for options
         return ft.Container()
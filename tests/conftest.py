@@ -0,0 +1,15 @@
+import pytest
+from risk_calculator.services.risk_calculator import RiskCalculationService
+from risk_calculator.services.validators import TradeValidationService
+
+
+@pytest.fixture(scope="module")
+def calculation_service():
+    """Stateless risk calculation service shared across a test module"""
+    return RiskCalculationService()
+
+
+@pytest.fixture(scope="module")
+def validation_service():
+    """Stateless trade validation service shared across a test module"""
+    return TradeValidationService()
@@ -0,0 +1,57 @@
+import pytest
+from decimal import Decimal
+from risk_calculator.models.equity_trade import EquityTrade
+from risk_calculator.services.realtime_validator import RealTimeValidationService
+from risk_calculator.services.validators import TradeValidationService
+
+
+class TestRealTimeValidationMessages:
+    """Unit tests for real-time field validation messages"""
+
+    def setup_method(self):
+        self.validator = RealTimeValidationService(TradeValidationService())
+        self.trade = EquityTrade(account_size=Decimal('10000'))
+
+    @pytest.mark.parametrize("field_name,value,expected_keywords", [
+        ("account_size", "not_a_number", {"account", "positive"}),
+        ("account_size", "-1000", {"account", "positive"}),
+        ("account_size", "0", {"account", "positive"}),
+        ("risk_percentage", "6", {"risk", "between"}),
+        ("entry_price", "abc", {"entry", "price", "positive"}),
+        ("entry_price", "Infinity", {"entry", "price", "positive"}),
+        ("fixed_risk_amount", "600", {"fixed", "between"}),
+    ], ids=["nonnumeric", "negative", "zero", "percentage_range", "price_nonnumeric", "price_infinity",
+            "fixed_amount_range"])
+    def test_invalid_value_message(self, field_name, value, expected_keywords):
+        """Test invalid values produce a message naming the problem"""
+        # When
+        message = self.validator.validate_field(field_name, value, "equity", self.trade)
+
+        # Then
+        assert message is not None
+        assert expected_keywords <= set(message.lower().split())
+
+    @pytest.mark.parametrize("field_name,value", [
+        ("account_size", ""),
+        ("account_size", "   "),
+        ("account_size", "10000"),
+        ("risk_percentage", "2.5"),
+        ("symbol", "AAPL"),
+        ("fixed_risk_amount", "200"),
+    ])
+    def test_valid_or_empty_value_has_no_message(self, field_name, value):
+        """Test valid values and in-progress empty input produce no message"""
+        assert self.validator.validate_field(field_name, value, "equity", self.trade) is None
+
+    def test_fixed_amount_limit_follows_account_size(self):
+        """Test fixed amount limit is re-evaluated when account size changes"""
+        # Given
+        assert self.validator.validate_field("fixed_risk_amount", "300", "equity", self.trade) is None
+
+        # When
+        self.trade.account_size = Decimal('5000')
+
+        # Then
+        message = self.validator.validate_field("fixed_risk_amount", "300", "equity", self.trade)
+        assert message is not None
+        assert "5% of account size" in message
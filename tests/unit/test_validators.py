@@ -0,0 +1,33 @@
+import pytest
+from decimal import Decimal
+from risk_calculator.services.validators import BaseValidationService
+
+
+class TestValidatePositiveDecimal:
+    """Unit tests for positive decimal parsing"""
+
+    def setup_method(self):
+        self.validator = BaseValidationService()
+
+    @pytest.mark.parametrize("value,expected", [
+        ("10000", Decimal('10000')),
+        (" 2.50 ", Decimal('2.50')),
+        ("1e3", Decimal('1000')),
+    ], ids=["integer", "padded_decimal", "exponent"])
+    def test_valid_value_is_parsed(self, value, expected):
+        """Test finite positive values are returned as Decimal"""
+        assert self.validator.validate_positive_decimal(value, "Entry price") == expected
+
+    @pytest.mark.parametrize("value", [
+        "NaN", "sNaN", "Infinity", "-Infinity", "inf", "0", "-5", "abc",
+    ])
+    def test_non_finite_or_non_positive_value_rejected(self, value):
+        """Test non-finite, non-positive and malformed values are rejected"""
+        with pytest.raises(ValueError, match="Entry price must be a valid positive number"):
+            self.validator.validate_positive_decimal(value, "Entry price")
+
+    @pytest.mark.parametrize("value", ["Infinity", "NaN"])
+    def test_non_finite_value_rejected_before_range_check(self, value):
+        """Test range-checked fields report non-finite input as invalid, not out of range"""
+        with pytest.raises(ValueError, match="Risk percentage must be a valid positive number"):
+            self.validator.validate_percentage(value, "Risk percentage")